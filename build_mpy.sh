@@ -0,0 +1,12 @@
+#!/bin/sh
+# Precompile the driver modules to .mpy for upload to the Pico W
+# Needs mpy-cross matching the firmware version (pip install mpy-cross)
+# -O3 drops asserts and line numbers, -march=armv6m is required for the
+# @micropython.native / @micropython.viper code on the RP2040 (Cortex-M0+)
+set -e
+
+for module in drive_base pio_pwm motion_sequence two_wheel_front_drive two_wheel_rear_drive \
+              demos_front demos_rear; do
+    mpy-cross -O3 -march=armv6m "$module.py"
+    echo "Built $module.mpy"
+done
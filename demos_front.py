@@ -0,0 +1,115 @@
+from two_wheel_front_drive import FrontDriveRobot
+from micropython import const
+from motion_sequence import MotionSequence
+
+# const() is only folded inside its own module, so mirror motion_sequence.DEBUG here
+_DEBUG = const(False)  # Set True along with motion_sequence.DEBUG to build loop labels
+
+# One robot shared by all demos - re-creating PWM objects between runs can glitch the pins
+_robot = None
+
+def get_robot():
+    global _robot
+    if _robot is None:
+        _robot = FrontDriveRobot()
+    return _robot
+
+# Demo program
+async def demo(stop_event=None):
+    robot = get_robot()
+    
+    print("Front-Wheel Drive Robot Demo")
+    print("2 powered wheels at FRONT, 2 static casters at REAR")
+    print("="*50)
+    
+    sequence = MotionSequence((
+        # Forward movement
+        ("Moving forward...", robot.forward, (60,), 2000),
+        (None, robot.stop, (), 1000),
+        
+        # Backward movement (casters will pivot)
+        ("Moving backward...", robot.backward, (60,), 2000),
+        (None, robot.stop, (), 1000),
+        
+        # Turn left while moving
+        ("Turning left (forward)...", robot.turn_left, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Turn right while moving
+        ("Turning right (forward)...", robot.turn_right, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Spin in place (left)
+        ("Spinning left in place...", robot.spin_left, (50,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Spin in place (right)
+        ("Spinning right in place...", robot.spin_right, (50,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Smooth arc turns
+        ("Arc left (gentle curve)...", robot.arc_left, (60, 60), 2000),
+        (None, robot.stop, (), 1000),
+        
+        ("Arc right (sharp curve)...", robot.arc_right, (60, 30), 2000),
+        (None, robot.stop, (), 1000),
+    ))
+    
+    try:
+        if await sequence.run(stop_event):
+            print("\nDemo complete!")
+    finally:
+        robot.stop()
+
+# Figure-8 pattern demo
+async def figure_eight(stop_event=None):
+    robot = get_robot()
+    
+    print("Figure-8 Pattern Demo")
+    
+    sequence = MotionSequence((
+        # First loop
+        ("First circle (right)...", robot.arc_right, (60, 40), 4000),
+        
+        # Second loop
+        ("Second circle (left)...", robot.arc_left, (60, 40), 4000),
+        
+        (None, robot.stop, (), 0),
+    ))
+    
+    try:
+        if await sequence.run(stop_event):
+            print("Figure-8 complete!")
+    finally:
+        robot.stop()
+
+# Obstacle avoidance simulation
+async def obstacle_avoidance_demo(stop_event=None):
+    """
+    Simulates obstacle avoidance behavior
+    In real application, use ultrasonic or IR sensors
+    """
+    robot = get_robot()
+    
+    print("Obstacle Avoidance Demo (simulated)")
+    print("Robot will move forward and make turns as if avoiding obstacles")
+    
+    steps = []
+    for i in range(3):
+        # Move forward
+        label = None
+        if _DEBUG:
+            label = f"Moving forward {i+1}..."
+        steps.append((label, robot.forward, (60,), 2000))
+        
+        # "Detect obstacle" - turn
+        steps.append((None, robot.stop, (), 300))
+        steps.append(("Avoiding obstacle (turning)...", robot.spin_right, (50,), 1000))
+        steps.append((None, robot.stop, (), 300))
+    sequence = MotionSequence(steps)
+    
+    try:
+        if await sequence.run(stop_event):
+            print("Avoidance demo complete!")
+    finally:
+        robot.stop()
@@ -0,0 +1,156 @@
+from two_wheel_rear_drive import RearDriveRobot
+from micropython import const
+from motion_sequence import MotionSequence
+
+# const() is only folded inside its own module, so mirror motion_sequence.DEBUG here
+_DEBUG = const(False)  # Set True along with motion_sequence.DEBUG to build loop labels
+
+# One robot shared by all demos - re-creating PWM objects between runs can glitch the pins
+_robot = None
+
+def get_robot():
+    global _robot
+    if _robot is None:
+        _robot = RearDriveRobot()
+    return _robot
+
+# Demo program
+async def demo(stop_event=None):
+    robot = get_robot()
+    
+    print("Rear-Wheel Drive Robot Demo")
+    print("2 powered wheels at REAR, 2 static casters at FRONT")
+    print("="*50)
+    
+    sequence = MotionSequence((
+        # Forward movement
+        ("Moving forward...", robot.forward, (60,), 2000),
+        (None, robot.stop, (), 1000),
+        
+        # Backward movement (rear-drive excels at this!)
+        ("Moving backward...", robot.backward, (60,), 2000),
+        (None, robot.stop, (), 1000),
+        
+        # Turn left (forward)
+        ("Turning left (forward)...", robot.turn_left_forward, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Turn right (forward)
+        ("Turning right (forward)...", robot.turn_right_forward, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Turn left (reverse) - very tight!
+        ("Turning left (reverse - tight turn)...", robot.turn_left_reverse, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Turn right (reverse) - very tight!
+        ("Turning right (reverse - tight turn)...", robot.turn_right_reverse, (60,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Spin in place
+        ("Spinning left...", robot.spin_left, (50,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        ("Spinning right...", robot.spin_right, (50,), 1500),
+        (None, robot.stop, (), 1000),
+        
+        # Arc movements forward
+        ("Arc left (forward)...", robot.arc_left, (60, 40), 2000),
+        (None, robot.stop, (), 1000),
+        
+        # Arc movements in reverse (special advantage of rear-drive!)
+        ("Arc left (reverse - very agile)...", robot.arc_left_reverse, (60, 30), 2000),
+        (None, robot.stop, (), 1000),
+    ))
+    
+    try:
+        if await sequence.run(stop_event):
+            print("\nDemo complete!")
+    finally:
+        robot.stop()
+
+# Parallel parking demo (rear-drive advantage!)
+async def parallel_parking_demo(stop_event=None):
+    robot = get_robot()
+    
+    print("Parallel Parking Demo")
+    print("Demonstrating rear-drive agility in reverse!")
+    
+    sequence = MotionSequence((
+        # Pull forward
+        ("Step 1: Moving forward...", robot.forward, (50,), 1500),
+        (None, robot.stop, (), 500),
+        
+        # Back up and turn right
+        ("Step 2: Backing up and turning right...", robot.turn_right_reverse, (50,), 1500),
+        (None, robot.stop, (), 500),
+        
+        # Back up and turn left to straighten
+        ("Step 3: Backing up and turning left to straighten...", robot.turn_left_reverse, (50,), 1000),
+        (None, robot.stop, (), 500),
+        
+        # Back up straight
+        ("Step 4: Backing straight...", robot.backward, (50,), 1000),
+        (None, robot.stop, (), 0),
+    ))
+    
+    try:
+        if await sequence.run(stop_event):
+            print("Parking complete!")
+    finally:
+        robot.stop()
+
+# Three-point turn demo
+async def three_point_turn(stop_event=None):
+    robot = get_robot()
+    
+    print("Three-Point Turn Demo")
+    
+    sequence = MotionSequence((
+        # Turn 1: Forward and turn right
+        ("Point 1: Forward right turn...", robot.arc_right, (50, 20), 2000),
+        (None, robot.stop, (), 500),
+        
+        # Turn 2: Reverse and turn left (rear-drive shines here!)
+        ("Point 2: Reverse left turn...", robot.arc_left_reverse, (50, 20), 2000),
+        (None, robot.stop, (), 500),
+        
+        # Turn 3: Forward and straighten
+        ("Point 3: Forward to complete turn...", robot.forward, (50,), 1500),
+        (None, robot.stop, (), 0),
+    ))
+    
+    try:
+        if await sequence.run(stop_event):
+            print("Three-point turn complete!")
+    finally:
+        robot.stop()
+
+# Navigation pattern
+async def navigation_pattern(stop_event=None):
+    robot = get_robot()
+    
+    print("Navigation Pattern: Exploring with reverse turning")
+    
+    steps = []
+    for i in range(3):
+        # Move forward
+        label = None
+        if _DEBUG:
+            label = f"Segment {i+1}: Moving forward..."
+        steps.append((label, robot.forward, (60,), 2000))
+        steps.append((None, robot.stop, (), 300))
+        
+        # Turn using reverse (rear-drive advantage)
+        label = None
+        if _DEBUG:
+            label = f"Segment {i+1}: Turning in reverse..."
+        steps.append((label, robot.turn_right_reverse, (55,), 1200))
+        steps.append((None, robot.stop, (), 300))
+    sequence = MotionSequence(steps)
+    
+    try:
+        if await sequence.run(stop_event):
+            print("Navigation pattern complete!")
+    finally:
+        robot.stop()
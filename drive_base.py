@@ -0,0 +1,282 @@
+from machine import Pin, PWM
+from array import array
+import micropython
+from micropython import const
+
+MAX_PCT = const(100)  # Speed range is -MAX_PCT to MAX_PCT
+
+# duty = speed * 65535 // 100 as a multiply and shift, exact for speeds 0-100
+_DUTY_MUL = const(1342157)
+_DUTY_SHIFT = const(11)
+
+@micropython.viper
+def _set_motor(fwd, rev, speed: int, last):
+    """
+    Clamp speed and write one motor's duty using native integer code
+    fwd, rev: bound duty_u16 methods of the motor's two pins
+    last: int32 array of the last duties written to fwd and rev
+    Pins whose duty is unchanged are not written again
+    """
+    last_duty = ptr32(last)
+    
+    if speed > MAX_PCT:
+        speed = MAX_PCT
+    elif speed < -MAX_PCT:
+        speed = -MAX_PCT
+    
+    fwd_duty = 0
+    rev_duty = 0
+    if speed > 0:
+        fwd_duty = (speed * _DUTY_MUL) >> _DUTY_SHIFT
+    elif speed < 0:
+        rev_duty = (-speed * _DUTY_MUL) >> _DUTY_SHIFT
+    
+    if fwd_duty != last_duty[0]:
+        fwd(fwd_duty)
+        last_duty[0] = fwd_duty
+    if rev_duty != last_duty[1]:
+        rev(rev_duty)
+        last_duty[1] = rev_duty
+
+# RP2040 PWM slice registers (datasheet 4.5.3)
+_PWM_BASE = const(0x40050000)
+_PWM_SLICE_SIZE = const(0x14)
+_PWM_CC = const(0x0c)    # Channel A level in bits 15:0, channel B in 31:16
+_PWM_TOP = const(0x10)
+
+@micropython.viper
+def _write_cc(cc_addr: int, speed: int):
+    """
+    Write one motor with a single store to its slice's compare register
+    fwd level goes in channel A and rev in channel B, scaled to the slice's TOP
+    the same way machine.PWM scales duty_u16
+    """
+    cc = ptr32(cc_addr)
+    top = uint(cc[(_PWM_TOP - _PWM_CC) >> 2]) & 0xffff
+    
+    pct = speed
+    if pct < 0:
+        pct = -pct
+    if pct >= MAX_PCT:
+        level = top + 1  # Fully on
+    else:
+        level = (uint((pct * _DUTY_MUL) >> _DUTY_SHIFT) * (top + 1)) >> 16
+    
+    if speed > 0:
+        cc[0] = level
+    elif speed < 0:
+        cc[0] = level << 16
+    else:
+        cc[0] = 0
+
+def turn_ratio_to_pct(turn_ratio_pct, turn_ratio=None):
+    """
+    Normalise arc turn arguments to an integer percent (0-100)
+    The legacy turn_ratio keyword is always a 0 to 1 ratio, int or float
+    A float turn_ratio_pct is also read as a 0.0 to 1.0 ratio
+    """
+    if turn_ratio is not None:
+        return round(turn_ratio * MAX_PCT)
+    if isinstance(turn_ratio_pct, float):
+        return round(turn_ratio_pct * MAX_PCT)
+    return turn_ratio_pct
+
+def scale_speed(speed, pct):
+    """
+    speed * pct / 100 in integers, truncated toward zero like the old float path
+    Floor division alone would round negative speeds away from zero
+    """
+    if speed < 0:
+        return -(-speed * pct // MAX_PCT)
+    return speed * pct // MAX_PCT
+
+class DifferentialDriveBase:
+    """
+    Shared driver for 2-wheel differential drive robots
+    Subclasses add the movements specific to front or rear wheel drive
+    set_motor, move, move_raw_duty and stop do not allocate, so they are safe to
+    call with micropython.heap_lock() held (pass int speeds; floats are heap objects)
+    use_pio: drive the motor pins from PIO state machines instead of the PWM slices,
+             started in phase; each pin is written separately, so the wheels can
+             pick up a new speed up to one period (~1ms) apart
+    use_natmod: route move() through the motordrv native module, which writes the
+                PWM compare registers directly (hardware PWM, default pins only)
+    use_mem32: same register writes from viper code, no native module build needed
+    """
+    def __init__(self, use_pio=False, use_natmod=False, use_mem32=False):
+        # Motor pins - adjust GPIO numbers based on your wiring
+        if use_pio:
+            # Soft PWM on PIO0 state machines 0-3, all four started in phase
+            from pio_pwm import PIOPWM, start_in_sync
+            self.left_fwd = PIOPWM(0, Pin(0))
+            self.left_rev = PIOPWM(1, Pin(1))
+            self.right_fwd = PIOPWM(2, Pin(2))
+            self.right_rev = PIOPWM(3, Pin(3))
+            start_in_sync(0b1111)
+        else:
+            # Left Motor (powered)
+            self.left_fwd = PWM(Pin(0))
+            self.left_rev = PWM(Pin(1))
+            
+            # Right Motor (powered)
+            self.right_fwd = PWM(Pin(2))
+            self.right_rev = PWM(Pin(3))
+            
+            # Set PWM frequency (1kHz is typical for DC motors)
+            self.left_fwd.freq(1000)
+            self.left_rev.freq(1000)
+            self.right_fwd.freq(1000)
+            self.right_rev.freq(1000)
+        
+        self.max_speed = 65535  # 16-bit PWM resolution
+        
+        # Cache bound duty_u16 methods to skip attribute lookups on hot paths
+        self._lf = self.left_fwd.duty_u16
+        self._lr = self.left_rev.duty_u16
+        self._rf = self.right_fwd.duty_u16
+        self._rr = self.right_rev.duty_u16
+        
+        # Last duty written to each motor's (fwd, rev) pins, -1 = unknown
+        self._last_left = array("l", (-1, -1))
+        self._last_right = array("l", (-1, -1))
+        self._last_other = array("l", (-1, -1))
+        
+        if use_natmod and not use_pio:
+            # Shadow move() on the instance so the hot path has no extra branch
+            import motordrv
+            self._motordrv_set = motordrv.set
+            self.move = self._move_natmod
+        elif use_mem32 and not use_pio:
+            # GPIO 0/1 are slice 0 A/B, GPIO 2/3 are slice 1 A/B
+            self._cc_left = _PWM_BASE + 0 * _PWM_SLICE_SIZE + _PWM_CC
+            self._cc_right = _PWM_BASE + 1 * _PWM_SLICE_SIZE + _PWM_CC
+            self.move = self._move_mem32
+        self.stop()
+    
+    def set_motor(self, fwd_pin, rev_pin, speed):
+        """
+        Set individual motor speed (-100 to 100)
+        Does not allocate for the robot's own pins; other pins allocate bound methods
+        """
+        speed = int(speed)
+        if fwd_pin is self.left_fwd and rev_pin is self.left_rev:
+            _set_motor(self._lf, self._lr, speed, self._last_left)
+        elif fwd_pin is self.right_fwd and rev_pin is self.right_rev:
+            _set_motor(self._rf, self._rr, speed, self._last_right)
+        else:
+            # Unknown pins - always write
+            last = self._last_other
+            last[0] = -1
+            last[1] = -1
+            _set_motor(fwd_pin.duty_u16, rev_pin.duty_u16, speed, last)
+    
+    @micropython.native
+    def move(self, left_speed, right_speed):
+        """
+        Move robot with differential drive control
+        left_speed: left motor speed (-100 to 100)
+        right_speed: right motor speed (-100 to 100)
+        """
+        _set_motor(self._lf, self._lr, int(left_speed), self._last_left)
+        _set_motor(self._rf, self._rr, int(right_speed), self._last_right)
+    
+    def _move_natmod(self, left_speed, right_speed):
+        """move() via motordrv: GPIO 0/1 are slice 0 A/B, GPIO 2/3 are slice 1 A/B"""
+        self._motordrv_set(0, 1, int(left_speed), int(right_speed))
+        self._forget_last()
+    
+    @micropython.native
+    def _move_mem32(self, left_speed, right_speed):
+        """move() as one compare register store per motor, latched at each slice's next wrap"""
+        _write_cc(self._cc_left, int(left_speed))
+        _write_cc(self._cc_right, int(right_speed))
+        self._forget_last()
+    
+    def _forget_last(self):
+        # Pins were written behind duty_u16, so the next cached write must go through
+        last_left = self._last_left
+        last_right = self._last_right
+        last_left[0] = -1
+        last_left[1] = -1
+        last_right[0] = -1
+        last_right[1] = -1
+    
+    def heap_lock_move(self, left_speed, right_speed):
+        """
+        move() with the MicroPython heap locked, for motion segments that must not trigger GC
+        Raises MemoryError if anything on the move path allocates
+        """
+        micropython.heap_lock()
+        try:
+            self.move(left_speed, right_speed)
+        finally:
+            micropython.heap_unlock()
+    
+    def move_raw_duty(self, lf, lr, rf, rr):
+        """
+        Fast path for control loops: write precomputed duties (0-65535) directly
+        lf, lr, rf, rr: left fwd/rev and right fwd/rev pin duties, no clamping
+        With use_pio, out-of-range duties knock that pin's PWM out of phase
+        """
+        last_left = self._last_left
+        last_right = self._last_right
+        self._lf(lf)
+        self._lr(lr)
+        self._rf(rf)
+        self._rr(rr)
+        last_left[0] = lf
+        last_left[1] = lr
+        last_right[0] = rf
+        last_right[1] = rr
+    
+    def forward(self, speed=50):
+        """Move forward"""
+        self.move(speed, speed)
+    
+    def backward(self, speed=50):
+        """Move backward"""
+        self.move(-speed, -speed)
+    
+    def spin_left(self, speed=50):
+        """Spin left in place"""
+        self.move(-speed, speed)
+    
+    def spin_right(self, speed=50):
+        """Spin right in place"""
+        self.move(speed, -speed)
+    
+    def arc_left(self, speed=50, turn_ratio_pct=50, turn_ratio=None):
+        """
+        Smooth arc turn to the left
+        turn_ratio_pct: 0 (sharp) to 100 (gentle)
+        turn_ratio: legacy 0.0 to 1.0 form, used instead when given
+        """
+        turn_ratio_pct = turn_ratio_to_pct(turn_ratio_pct, turn_ratio)
+        right_speed = speed
+        left_speed = scale_speed(speed, turn_ratio_pct)
+        self.move(left_speed, right_speed)
+    
+    def arc_right(self, speed=50, turn_ratio_pct=50, turn_ratio=None):
+        """
+        Smooth arc turn to the right
+        turn_ratio_pct: 0 (sharp) to 100 (gentle)
+        turn_ratio: legacy 0.0 to 1.0 form, used instead when given
+        """
+        turn_ratio_pct = turn_ratio_to_pct(turn_ratio_pct, turn_ratio)
+        left_speed = speed
+        right_speed = scale_speed(speed, turn_ratio_pct)
+        self.move(left_speed, right_speed)
+    
+    def stop(self):
+        """Stop all motors"""
+        # Always write, so stop() also recovers from out-of-band pin writes
+        last_left = self._last_left
+        last_right = self._last_right
+        self._lf(0)
+        self._lr(0)
+        self._rf(0)
+        self._rr(0)
+        last_left[0] = 0
+        last_left[1] = 0
+        last_right[0] = 0
+        last_right[1] = 0
@@ -0,0 +1,135 @@
+from machine import Timer
+from micropython import const
+import asyncio
+
+DEBUG = const(False)  # Set True to print step labels as they run
+_MAX_ARGS = const(4)  # Longest args tuple _run_step() unpacks
+
+# Sequence started most recently and not yet finished, see cancel_current()
+_current = None
+
+def cancel_current():
+    """
+    Cancel the running sequence, if any
+    Use from a KeyboardInterrupt handler: Ctrl-C lands in the asyncio scheduler,
+    so run()'s cleanup never runs and the timer would keep issuing steps
+    """
+    global _current
+    if _current is not None:
+        _current.cancel()
+        _current = None
+
+def run(coro, robot):
+    """
+    asyncio.run(coro) that still stops the robot on Ctrl-C
+    Ctrl-C lands in the asyncio scheduler, so the coroutine's own cleanup never runs
+    """
+    try:
+        return asyncio.run(coro)
+    except KeyboardInterrupt:
+        print("\nStopping robot...")
+        cancel_current()  # Disarm the step timer first, or it restarts the motors
+        robot.stop()
+
+class MotionSequence:
+    """
+    Run timed motor commands from a one-shot machine.Timer instead of sleeping
+    steps: (label, action, args, duration_ms) tuples, e.g.
+           ("Moving forward...", robot.forward, (60,), 2000)
+    label is printed when the step starts if DEBUG is set (None for no message)
+    args may hold up to 4 values, enough for robot.move_raw_duty()
+    The timer callback only indexes pre-built tuples, so it does not allocate
+    """
+    def __init__(self, steps):
+        for step in steps:
+            if len(step[2]) > _MAX_ARGS:
+                raise ValueError("step args: at most 4 values")
+        self._steps = steps
+        self._count = len(steps)
+        self._i = 0
+        self._cancelled = False
+        self._timer = Timer(-1)
+        self._done = asyncio.ThreadSafeFlag()
+        
+        # Bind the callback once - passing self._advance would allocate a bound method per step
+        self._advance_cb = self._advance
+    
+    def _run_step(self):
+        label, action, args, duration_ms = self._steps[self._i]
+        if DEBUG:
+            if label:
+                print(label)
+        
+        n = len(args)
+        if n == 0:
+            action()
+        elif n == 1:
+            action(args[0])
+        elif n == 2:
+            action(args[0], args[1])
+        elif n == 3:
+            action(args[0], args[1], args[2])
+        else:
+            action(args[0], args[1], args[2], args[3])
+        
+        if duration_ms:
+            self._timer.init(mode=Timer.ONE_SHOT, period=duration_ms, callback=self._advance_cb)
+        else:
+            self._advance(None)
+    
+    def _advance(self, timer):
+        # A callback already scheduled when cancel() ran must not drive the motors
+        if self._cancelled:
+            return
+        self._i += 1
+        if self._i < self._count:
+            self._run_step()
+        else:
+            self._done.set()
+    
+    def start(self):
+        """Run the first step now and schedule the rest"""
+        global _current
+        _current = self
+        self._i = 0
+        self._cancelled = False
+        if self._count == 0:
+            self._done.set()
+            return
+        self._run_step()
+    
+    def cancel(self):
+        """Stop scheduling further steps"""
+        self._cancelled = True
+        self._timer.deinit()
+        self._done.set()
+    
+    async def _cancel_on(self, stop_event):
+        await stop_event.wait()
+        self.cancel()
+    
+    async def run(self, stop_event=None):
+        """
+        Start the sequence and wait until the last step has finished
+        stop_event: optional asyncio.Event that ends the sequence early when set
+        Returns True if every step ran, False if it was cancelled
+        The motors are left as the last step set them, call robot.stop() if needed
+        """
+        global _current
+        if stop_event is not None and stop_event.is_set():
+            return False
+        
+        watcher = None
+        if stop_event is not None:
+            watcher = asyncio.create_task(self._cancel_on(stop_event))
+        
+        self.start()
+        try:
+            await self._done.wait()
+        finally:
+            self._timer.deinit()
+            if _current is self:
+                _current = None
+            if watcher is not None:
+                watcher.cancel()
+        return self._i >= self._count
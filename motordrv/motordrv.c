@@ -0,0 +1,53 @@
+// Native module that writes RP2040 PWM compare registers directly
+// motordrv.set(slice_left, slice_right, left_speed, right_speed)
+// Each motor's fwd pin must be channel A (even GPIO) and rev pin channel B
+// (the next GPIO) of its slice, as with the default pins 0/1 and 2/3
+#include "py/dynruntime.h"
+
+#define PWM_BASE        (0x40050000)
+#define PWM_SLICE_SIZE  (0x14)
+#define PWM_CC_OFFSET   (0x0c)
+#define PWM_TOP_OFFSET  (0x10)
+
+#define MAX_PCT         (100)
+// duty_u16 = speed * 65535 / 100 as a multiply and shift (exact for 0-100)
+#define DUTY_MUL        (1342157)
+#define DUTY_SHIFT      (11)
+
+static void set_slice(mp_int_t slice, mp_int_t speed) {
+    uintptr_t base = PWM_BASE + (slice & 7) * PWM_SLICE_SIZE;
+    uint32_t top = *(volatile uint32_t *)(base + PWM_TOP_OFFSET) & 0xffff;
+
+    mp_uint_t pct = speed < 0 ? -speed : speed;
+    uint32_t level;
+    if (pct >= MAX_PCT) {
+        level = top + 1;  // Fully on
+    } else {
+        // Scale duty_u16 to the slice's TOP like machine.PWM does
+        uint32_t duty = (pct * DUTY_MUL) >> DUTY_SHIFT;
+        level = (duty * (top + 1)) >> 16;
+    }
+
+    uint32_t cc = 0;
+    if (speed > 0) {
+        cc = level;        // Channel A = fwd
+    } else if (speed < 0) {
+        cc = level << 16;  // Channel B = rev
+    }
+    *(volatile uint32_t *)(base + PWM_CC_OFFSET) = cc;
+}
+
+static mp_obj_t set(size_t n_args, const mp_obj_t *args) {
+    set_slice(mp_obj_get_int(args[0]), mp_obj_get_int(args[2]));
+    set_slice(mp_obj_get_int(args[1]), mp_obj_get_int(args[3]));
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(set_obj, 4, 4, set);
+
+mp_obj_t mpy_init(mp_obj_fun_bc_t *self, size_t n_args, size_t n_kw, mp_obj_t *args) {
+    MP_DYNRUNTIME_INIT_ENTRY
+
+    mp_store_global(MP_QSTR_set, MP_OBJ_FROM_PTR(&set_obj));
+
+    MP_DYNRUNTIME_INIT_EXIT
+}
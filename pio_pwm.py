@@ -0,0 +1,54 @@
+from machine import mem32
+import machine
+import rp2
+
+PERIOD = 65535  # PWM counts per period, matches duty_u16 range
+
+# Atomic bit-set alias of the PIO0 CTRL register (RP2040 datasheet 2.1.2, 3.7)
+_PIO0_CTRL_SET = 0x50200000 + 0x2000
+
+@rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW)
+def _pwm_prog():
+    # Drain the TX FIFO so the newest duty wins, X keeps the current duty
+    pull(noblock)       .side(0)
+    mov(x, osr)
+    pull(noblock)
+    mov(x, osr)
+    pull(noblock)
+    mov(x, osr)
+    pull(noblock)
+    mov(x, osr)
+    mov(y, isr)         # ISR is preloaded with PERIOD
+    label("count")
+    jmp(x_not_y, "skip")
+    nop()               .side(1)
+    label("skip")
+    jmp(y_dec, "count")
+
+class PIOPWM:
+    """
+    Soft PWM output on one PIO0 state machine, usable in place of machine.PWM
+    duty_u16(0) leaves a single ~16ns pulse per period, which a motor driver ignores
+    New duties are latched at the start of the next period
+    duty must stay within 0-PERIOD: a larger value skips the high cycles and
+    shortens this SM's period, so it drifts out of phase with the others
+    duty_u16 blocks once 4 duties are queued, i.e. if written more than 4 times
+    per period (~1ms); at most the newest of them takes effect
+    """
+    def __init__(self, sm_id, pin, freq=1000):
+        # 2 cycles per count, capped at the system clock (~950Hz at 125MHz)
+        sm_freq = min(2 * (PERIOD + 1) * freq, machine.freq())
+        self._sm = rp2.StateMachine(sm_id, _pwm_prog, freq=sm_freq, sideset_base=pin)
+        
+        # Load the period into ISR, then queue a zero duty
+        self._sm.put(PERIOD)
+        self._sm.exec("pull()")
+        self._sm.exec("mov(isr, osr)")
+        self._sm.put(0)
+        
+        # Same call signature as PWM.duty_u16, so bound-method caching still works
+        self.duty_u16 = self._sm.put
+
+def start_in_sync(mask):
+    """Enable the PIO0 state machines in mask together with phase-aligned clocks"""
+    mem32[_PIO0_CTRL_SET] = mask | (mask << 8)  # SM_ENABLE | CLKDIV_RESTART
@@ -0,0 +1,28 @@
+from motion_sequence import run
+
+# Shared runner for the front and rear drive demos
+# Pick the robot and demo below, or save this file as main.py to run on boot
+DRIVE = "front"  # "front" or "rear"
+DEMO = "demo"    # front: demo, figure_eight, obstacle_avoidance_demo
+                 # rear: demo, parallel_parking_demo, three_point_turn, navigation_pattern
+
+if DRIVE == "front":
+    import demos_front as demos
+    banner = (
+        "FRONT-WHEEL DRIVE ROBOT",
+        "Powered wheels: FRONT | Static wheels: REAR",
+    )
+else:
+    import demos_rear as demos
+    banner = (
+        "REAR-WHEEL DRIVE ROBOT",
+        "Powered wheels: REAR | Static wheels: FRONT",
+        "Special advantage: Superior reverse turning!",
+    )
+
+print("\n" + "="*50)
+for line in banner:
+    print(line)
+print("="*50 + "\n")
+
+run(getattr(demos, DEMO)(), demos.get_robot())